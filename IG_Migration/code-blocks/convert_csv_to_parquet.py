@@ -0,0 +1,28 @@
+"""
+convert_csv_to_parquet.py
+
+One-off conversion of the migration CSVs to Parquet (requires pyarrow).
+
+final.py and gptstudies.py read <name>.parquet in place of <name>.csv whenever
+the copy records the CSV's current size and mtime, so repeated migration runs skip
+CSV parsing; each run prints which file it read. Re-run this after replacing a
+CSV; up-to-date copies are skipped.
+"""
+
+from csv_io import fresh_parquet, write_parquet
+from final import AGREEMENT_FILE, TRAINING_FILE
+from gptstudies import ASSETS_FILE, CONTRACTS_FILE, STUDIES_FILE
+
+SOURCES = (TRAINING_FILE, AGREEMENT_FILE, STUDIES_FILE, ASSETS_FILE, CONTRACTS_FILE)
+
+
+def main() -> None:
+    for filename in SOURCES:
+        if fresh_parquet(filename):
+            print(f"Skipped {filename} (Parquet copy is up to date)")
+            continue
+        print(f"Wrote {write_parquet(filename)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+CSV reading and value parsing shared by final.py and gptstudies.py.
+
+Both scripts read SharePoint list exports, which arrive with a BOM, quoted
+headers and DD/MM/YYYY dates, so header cleaning, column selection and the
+cell parsers live here once.
+"""
+
+import codecs
+import csv
+import os
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv  # optional multi-threaded C++ CSV parser
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Parquet metadata key holding the source CSV's "size:mtime_ns"
+_SOURCE_KEY = b"csv_io.source"
+
+# Leading BOM/quotes/whitespace or trailing quotes/whitespace, in one pass
+_HDR_RE = re.compile(r'^[\ufeff"\s]+|[\s"]+$')
+
+
+def clean_headers(header: list[str]) -> list[str]:
+    """Clean CSV headers by stripping BOM, whitespace, and quotes."""
+    return [_HDR_RE.sub("", h) for h in header]
+
+
+TRUE_VALUES = frozenset({"true", "1", "yes", "y"})
+
+EXT_SUFFIX = "#EXT#@liveuclac.onmicrosoft.com"
+UCL_SUFFIX = "@ucl.ac.uk"
+
+
+def to_bool(s: str | None) -> bool:
+    return str(s or "").strip().lower() in TRUE_VALUES
+
+
+@lru_cache(maxsize=None)
+def parse_ddmmyyyy(ds: str) -> datetime | None:
+    """
+    Parse a stripped DD/MM/YYYY string, or return None if it is invalid.
+
+    Cached, as the same dates repeat across many rows, and scanned by hand
+    rather than through strptime, accepting the same 1-2 digit day/month and
+    4 digit year.
+    """
+    day, sep1, rest = ds.partition("/")
+    month, sep2, year = rest.partition("/")
+    digits = day + month + year
+    if not (sep1 and sep2 and 0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4
+            and digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def parse_date(date_str: str | None) -> str | None:
+    """
+    Parse a CSV date in DD/MM/YYYY format and return an ISO string YYYY-MM-DD.
+
+    Returns:
+        str: ISO date string (YYYY-MM-DD) if valid
+        None: if input is empty or invalid
+    """
+    ds = (date_str or "").strip()
+    if not ds:
+        return None
+    dt = parse_ddmmyyyy(ds)  # cached there
+    return dt.date().isoformat() if dt else None  # return ISO string directly
+
+
+def validate_iso_date(date_str: str | None) -> datetime | None:
+    """
+    Parse a strict ISO date (YYYY-MM-DD).
+
+    Returns:
+      datetime if valid
+      None if empty or invalid
+    """
+    ds = (date_str or "").strip()
+    if not ds:
+        return None
+
+    try:
+        return datetime.strptime(ds, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def normalise_usernames(values: Iterable[str]) -> list[str]:
+    """
+    Normalises usernames to required email format so that training and agreement records align.
+
+    Rules:
+    - Trim whitespace
+    - Lowercase
+    - If it contains '@', treat it as an email address and convert to EXT UPN:
+        - Replace '@' with '_'
+        - Append '#EXT#@liveuclac.onmicrosoft.com'
+    - If it does NOT contain '@', append '@ucl.ac.uk'
+
+    Works over a whole column in one comprehension rather than one call per row.
+    """
+    # Need to deal with nop- prefexied UserIDs from the Training list 
+    return [
+        v.replace("@", "_") + EXT_SUFFIX if "@" in v else v + UCL_SUFFIX
+        for v in (value.strip().lower() for value in values)
+    ]
+
+
+def read_columns(
+    filename: str, names: tuple[str, ...], encoding: str = "utf-8"
+) -> Iterator[tuple[str | None, ...]]:
+    """
+    Iterate over only the named columns of each CSV row, in the order given.
+
+    Missing columns and short rows read as None and present but blank cells
+    as "", with blank lines skipped (all as csv.DictReader does).
+
+    With pyarrow installed, a Parquet copy written from the CSV as it is now
+    (see write_parquet) is read instead; failing that the CSV is parsed with
+    pyarrow if it is regular enough, otherwise with the csv module. The source
+    actually read is printed, so a Parquet stand-in is never silent.
+    """
+    path = fresh_parquet(filename)
+    if path is not None:
+        _report(f"Reading {path} (Parquet copy of {filename})")
+        return _read_columns_parquet(path, names)
+    _report(f"Reading {filename}")
+    return _read_csv_columns(filename, names, encoding)
+
+
+def _report(message: str) -> None:
+    # One write per line: loaders run in threads, and print() writes the
+    # newline separately, which lets lines interleave
+    sys.stdout.write(message + "\n")
+
+
+def parquet_path(filename: str) -> str:
+    """Parquet copy kept next to a CSV: studies.csv -> studies.parquet."""
+    return os.path.splitext(filename)[0] + ".parquet"
+
+
+def _source_stamp(filename: str) -> bytes:
+    """Size and mtime of a CSV, recorded in its Parquet copy's metadata."""
+    st = os.stat(filename)
+    return f"{st.st_size}:{st.st_mtime_ns}".encode()
+
+
+def fresh_parquet(filename: str) -> str | None:
+    """
+    Return the Parquet copy of filename if it was written from the CSV as it is now.
+
+    The copy must carry the CSV's current size and mtime (see write_parquet);
+    an mtime comparison alone would let an older copy shadow a CSV restored
+    with its original timestamp.
+    """
+    if pa is None:
+        return None
+    path = parquet_path(filename)
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        if metadata.get(_SOURCE_KEY) == _source_stamp(filename):
+            return path
+    except (OSError, pa.ArrowInvalid):
+        pass
+    return None
+
+
+def write_parquet(filename: str, encoding: str = "utf-8") -> str:
+    """
+    Convert a CSV to a zstd-compressed Parquet copy, every column as a string.
+
+    Headers are cleaned and rows normalised exactly as read_columns does, so
+    reading the copy yields the same values as reading the CSV.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to write Parquet files")
+
+    stamp = _source_stamp(filename)  # before reading, so a concurrent rewrite invalidates the copy
+    with open(filename, newline="", encoding=encoding) as f:
+        header = tuple(dict.fromkeys(clean_headers(next(csv.reader(f), []))))
+    rows = list(_read_csv_columns(filename, header, encoding))
+    columns = list(zip(*rows)) or [()] * len(header)
+    table = pa.table({h: pa.array(col, type=pa.string()) for h, col in zip(header, columns)})
+    table = table.replace_schema_metadata({_SOURCE_KEY: stamp})
+
+    path = parquet_path(filename)
+    pq.write_table(table, path, compression="zstd")
+    return path
+
+
+def _read_columns_parquet(
+    path: str, names: tuple[str, ...]
+) -> Iterator[tuple[str | None, ...]]:
+    """Read only the named columns from a Parquet copy written by write_parquet."""
+    present = set(pq.read_schema(path).names)
+    wanted = [n for n in dict.fromkeys(names) if n in present]
+    table = pq.read_table(path, columns=wanted)
+
+    columns = {n: table.column(n).to_pylist() for n in wanted}
+    missing = [None] * table.num_rows
+    return zip(*(columns.get(n, missing) for n in names))
+
+
+def _read_csv_columns(
+    filename: str, names: tuple[str, ...], encoding: str
+) -> Iterator[tuple[str | None, ...]]:
+    if pa is not None:
+        rows = _read_columns_arrow(filename, names, encoding)
+        if rows is not None:
+            return rows
+    return _read_columns_csv(filename, names, encoding)
+
+
+def _read_columns_arrow(
+    filename: str, names: tuple[str, ...], encoding: str
+) -> Iterator[tuple[str | None, ...]] | None:
+    """
+    Parse the whole file with pyarrow, every column typed as a string.
+
+    Returns None when pyarrow rejects the file (e.g. short or ragged rows),
+    the header repeats a name, or a header cell spans lines (skip_rows counts
+    physical lines, not records), so the caller can fall back to the csv module.
+    """
+    with open(filename, newline="", encoding=encoding) as f:
+        raw_header = next(csv.reader(f), [])
+    if any("\n" in h or "\r" in h for h in raw_header):
+        return None
+    header = clean_headers(raw_header)
+    if not header or len(set(header)) != len(header):
+        return None
+
+    wanted = [n for n in dict.fromkeys(names) if n in header]
+    encoding = codecs.lookup(encoding).name
+    try:
+        table = pacsv.read_csv(
+            filename,
+            read_options=pacsv.ReadOptions(
+                column_names=header,
+                skip_rows=1,
+                encoding="utf8" if encoding == "utf-8" else encoding,
+            ),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={h: pa.string() for h in header},
+                include_columns=wanted,
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+
+    columns = {n: table.column(n).to_pylist() for n in wanted}
+    missing = [None] * table.num_rows
+    return zip(*(columns.get(n, missing) for n in names))
+
+
+def _read_columns_csv(
+    filename: str, names: tuple[str, ...], encoding: str
+) -> Iterator[tuple[str | None, ...]]:
+    """
+    Yield the named columns row by row with the csv module.
+
+    Column positions are resolved once from the cleaned header, so rows are
+    plain csv.reader lists rather than one dict per row.
+    """
+    # A 1 MiB buffer hands the decoder and csv.reader large chunks per read
+    with open(filename, newline="", encoding=encoding, buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = clean_headers(next(reader, []))
+        width = len(header)
+        index = {h: i for i, h in enumerate(header)}
+        positions = [index.get(n, -1) for n in names]  # -1 -> trailing None
+        if not positions:  # itemgetter() needs at least one index
+            pick = lambda row: ()
+        elif len(positions) == 1:
+            pick = lambda row, p=positions[0]: (row[p],)
+        else:
+            pick = itemgetter(*positions)
+        pad = [None] * width
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += pad[len(row):]
+            row.append(None)
+            yield pick(row)
@@ -1,8 +1,11 @@
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
 
-@dataclass
+from csv_io import normalise_usernames, parse_ddmmyyyy, read_columns
+
+@dataclass(slots=True)
 class Record:
     username: str
     has_signed_agreement: bool
@@ -13,118 +16,75 @@ TRAINING_FILE = "training.csv"
 AGREEMENT_FILE = "agreement.csv"
 OUTPUT_FILE = "import.csv"
 
-def normalise_username(value: str) -> str:
-    """
-    Normalises usernames to required email format so that training and agreement records align.
-
-    Rules:
-    - Trim whitespace
-    - Lowercase
-    - If it contains '@', treat it as an email address and convert to EXT UPN:
-        - Replace '@' with '_'
-        - Append '#EXT#@liveuclac.onmicrosoft.com'
-    - If it does NOT contain '@', append '@ucl.ac.uk'
-    """
-    value = value.strip().lower()
-
-    if "@" in value:
-        value = value.replace("@", "_")
-        return f"{value}#EXT#@liveuclac.onmicrosoft.com"
-    # Need to deal with nop- prefexied UserIDs from the Training list 
-    return f"{value}@ucl.ac.uk"
-
-
-def clean_headers(reader: csv.DictReader) -> None:
-    """Clean CSV headers by stripping BOM, whitespace, and quotes."""
-    reader.fieldnames = [
-        h.lstrip("\ufeff").strip().strip('"') for h in reader.fieldnames
-    ]
-
-
 def load_training() -> dict[str, datetime | None]:
-    training = {}
-
-    with open(TRAINING_FILE, newline="") as f:
-        reader = csv.DictReader(f)
-        clean_headers(reader)
+    users: list[str] = []
+    dates: list[datetime | None] = []
 
-        for row in reader:
+    for other_email, userid, date_str in read_columns(
+        TRAINING_FILE, ("Other email", "UserID", "LastTrained")
+    ):
+        user = (other_email or "").strip() or (userid or "").strip()
+        if not user:
+            continue  # if no userid or ext email, skip
 
-            other_email = (row.get("Other email") or "").strip()
-            userid = (row.get("UserID") or "").strip()
+        date_str = (date_str or "").strip()
 
-            if other_email:
-                user = normalise_username(other_email)
-            elif userid:
-                user = normalise_username(userid)
-            else:
-                continue  # if no userid or ext email, skip
+        users.append(user)
+        dates.append(parse_ddmmyyyy(date_str) if date_str else None)
 
-            date_str = (row.get("LastTrained") or "").strip()
-            training_date = None
-            if date_str:
-                try:
-                    training_date = datetime.strptime(date_str, "%d/%m/%Y")
-                except ValueError:
-                    pass
-
-            training[user] = training_date
-
-    return training
+    return dict(zip(normalise_usernames(users), dates))
 
 
 def load_agreements() -> dict[str, bool]:
-    agreements = {}
-    with open(AGREEMENT_FILE, newline="") as f:
-        reader = csv.DictReader(f)
-        clean_headers(reader)
+    users: list[str] = []
+    signed: list[bool] = []
 
-        for row in reader:
-            # Skip rows missing required columns
-            if not row.get("UserID") or not row.get("Approved"):
-                continue
+    for userid, approved in read_columns(AGREEMENT_FILE, ("UserID", "Approved")):
+        # Skip rows missing required columns
+        if not userid or not approved:
+            continue
 
-            user = normalise_username(row.get("UserID"))
-            has_signed = row.get("Approved").strip().lower() == "true"
+        users.append(userid)
+        signed.append(approved.strip().lower() == "true")
 
-            agreements[user] = has_signed
-
-    return agreements
+    return dict(zip(normalise_usernames(users), signed))
 
 
 def merge_records() -> list[Record]:
-    training = load_training()
-    agreements = load_agreements()
-
-    # All users who appear in either CSV, sorted alphabetically
-    all_users = sorted(set(training) | set(agreements))
-
-    merged_records: list[Record] = []
-
-    for user in all_users:
-        has_agreed = agreements.get(user, False)
-        training_date = training.get(user, None)
-
-        merged_records.append(
-            Record(
-                username=user,
-                has_signed_agreement=has_agreed,
-                nhsd_training_completed_at=training_date,
-            )
-        )
-    return merged_records
+    # The two files are independent; pyarrow parses without holding the GIL,
+    # so when it is installed the loads overlap
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        training_future = pool.submit(load_training)
+        agreements_future = pool.submit(load_agreements)
+        training, agreements = training_future.result(), agreements_future.result()
+
+    # All users who appear in either CSV, sorted alphabetically.
+    # Only agreement-only users go through a temporary set; the list is sorted in place.
+    all_users = list(training)
+    all_users.extend(agreements.keys() - training.keys())
+    all_users.sort()
+
+    has_agreed = agreements.get
+    training_date = training.get
+
+    return [
+        Record(user, has_agreed(user, False), training_date(user))
+        for user in all_users
+    ]
 
 
 def write_output(records: list[Record]):
-    with open(OUTPUT_FILE, "w", newline="") as f:
+    with open(OUTPUT_FILE, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
-        
-        for r in records:
-            writer.writerow([
+
+        writer.writerows(
+            (
                 r.username,
-                str(r.has_signed_agreement).lower(),  # "True" or "False" to "true" or "false"
+                "true" if r.has_signed_agreement else "false",
                 r.nhsd_training_completed_at.strftime("%Y-%m-%d") if r.nhsd_training_completed_at else "",
-            ])
+            )
+            for r in records
+        )
 
 
 def main():
@@ -16,10 +16,19 @@ Files:
 Adjust the constants below as needed.
 """
 
-import csv
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from csv_io import TRUE_VALUES, parse_date, read_columns, to_bool, validate_iso_date
+
+try:
+    import orjson  # optional C serializer, much faster than json for indented output
+except ImportError:
+    orjson = None
 
 
 STUDIES_FILE = "studies.csv"
@@ -33,51 +42,60 @@ JSON_INDENT = 2
 # Validate date fields strictly as YYYY-MM-DD
 VALIDATE_DATES = True
 
-def clean_headers(reader: csv.DictReader) -> None:
-    """Clean CSV headers by stripping BOM, whitespace, and quotes."""
-    reader.fieldnames = [
-        h.lstrip("\ufeff").strip().strip('"') for h in reader.fieldnames
-    ]
 
+def _text_column(col: Tuple[str, ...]) -> List[str]:
+    return list(map(str.strip, col))
 
-def to_bool(s: Optional[str]) -> bool:
-    return str(s or "").strip().lower() in {"true", "1", "yes", "y"}
 
+def _optional_text_column(col: Tuple[str, ...]) -> List[Optional[str]]:
+    return [v or None for v in map(str.strip, col)]
 
-def parse_date(date_str: str) -> Optional[str]:
-    """
-    Parse a CSV date in DD/MM/YYYY format and return an ISO string YYYY-MM-DD.
-    
-    Returns:
-        str: ISO date string (YYYY-MM-DD) if valid
-        None: if input is empty or invalid
-    """
-    ds = (date_str or "").strip()
-    if not ds:
-        return None
-    try:
-        dt = datetime.strptime(ds, "%d/%m/%Y")
-        return dt.strftime("%Y-%m-%d")  # return ISO string directly
-    except ValueError:
-        return None
-    
-
-def validate_json_date(date_str: str) -> Optional[datetime]:
-    """
-    Parse a strict ISO date (YYYY-MM-DD).
 
-    Returns:
-      datetime if valid
-      None if empty or invalid
-    """
-    ds = (date_str or "").strip()
-    if not ds:
-        return None
+def _bool_column(col: Tuple[str, ...]) -> List[bool]:
+    return list(map(TRUE_VALUES.__contains__, map(str.lower, map(str.strip, col))))
+
+
+def _present_column(col: Tuple[str, ...]) -> List[Optional[bool]]:
+    return [True if v else None for v in map(str.strip, col)]
+
+
+def _date_column(col: Tuple[str, ...]) -> List[Optional[str]]:
+    return list(map(parse_date, col))
 
-    try:
-        return datetime.strptime(ds, "%Y-%m-%d")
-    except ValueError:
-        return None
+
+# (study key, CSV column, column converter), in output key order.
+# Each converter runs once over a whole column rather than once per cell.
+STUDY_FIELDS = (
+    ("caseref", "CaseRef", _text_column),
+    ("owner_user_id", "OwnerUserID", _text_column),
+    ("admin_user_id", "AdminUserID", _text_column),
+    ("title", "Title", _text_column),
+    ("approval_status", "ApprovalStatus", _text_column),
+    ("description", "Description", _optional_text_column),
+    ("data_controller_organisation", "DataControllerOrganisation", _text_column),
+    ("involves_ucl_sponsorship", "InvolvesUclSponsorship", _bool_column),
+    ("involves_cag", "InvolvesCag", _bool_column),
+    ("cag_reference", "CagReference", _optional_text_column),
+    ("involves_ethics_approval", "InvolvesEthicsApproval", _bool_column),
+    ("involves_hra_approval", "InvolvesHraApproval", _bool_column),
+    ("iras_id", "IrasId", _optional_text_column),
+    ("is_nhs_associated", "IsNhsAssociated", _bool_column),
+    ("involves_nhs_england", "InvolvesNhsEngland", _bool_column),
+    ("nhs_england_reference", "NhsEnglandReference", _optional_text_column),
+    ("involves_mnca", "InvolvesMnca", _bool_column),
+    ("requires_dspt", "RequiresDspt", _bool_column),
+    ("requires_dbs", "RequiresDbs", _bool_column),
+    ("is_data_protection_office_registered", "DataProtectionNumber", _present_column),
+    ("data_protection_number", "DataProtectionNumber", _optional_text_column),
+    ("involves_third_party", "InvolvesThirdParty", _bool_column),
+    ("involves_external_users", "InvolvesExternalUsers", _bool_column),
+    ("involves_participant_consent", "InvolvesParticipantConsent", _bool_column),
+    ("involves_indirect_data_collection", "InvolvesIndirectDataCollection", _bool_column),
+    ("involves_data_processing_outside_uk_eea", "InvolvesDataProcessingOutsideUkEea", _bool_column),
+    ("dsh_active", "DSHActive", _bool_column),
+    ("last_signoff", "IAOSignoff", _date_column),
+    ("feedback", "Feedback", _optional_text_column),
+)
 
 
 def read_studies(filename: str) -> Dict[str, dict]:
@@ -92,58 +110,51 @@ def read_studies(filename: str) -> Dict[str, dict]:
       InvolvesExternalUsers,InvolvesParticipantConsent,InvolvesIndirectDataCollection,
       InvolvesDataProcessingOutsideUkEea,Feedback
     """
+    rows = list(read_columns(filename, tuple(c for _, c, _ in STUDY_FIELDS)))
+
+    # Convert column by column, then zip the columns back into one dict per study
+    columns = [
+        convert(tuple(v or "" for v in col))  # missing column / short row -> ""
+        for (_, _, convert), col in zip(STUDY_FIELDS, zip(*rows))
+    ]
+
+    if columns and "" in columns[0]:
+        line = columns[0].index("") + 2  # header is line 1
+        raise ValueError(f"Study row missing CaseRef (line {line})")
+
+    keys = [key for key, _, _ in STUDY_FIELDS]
     studies: Dict[str, dict] = {}
-    with open(filename, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        clean_headers(reader)
-        for i, row in enumerate(reader, start=2):  # header is line 1
-            case_ref = (row.get("CaseRef") or "").strip()
-            if not case_ref:
-                raise ValueError(f"Study row missing CaseRef (line {i})")
-            # if case_ref in studies:
-            #     raise ValueError(f"Duplicate CaseRef in studies.csv at line {i}: {case_ref}")
-
-            signoff_raw = row.get("IAOSignoff")
-            last_signoff = parse_date(signoff_raw)
-
-            studies[case_ref] = {
-                "caseref": case_ref,
-                "owner_user_id": (row.get("OwnerUserID") or "").strip(),
-                "admin_user_id": (row.get("AdminUserID") or "").strip(),
-                "title": (row.get("Title") or "").strip(),
-                "approval_status": (row.get("ApprovalStatus") or "").strip(),
-                "description": ((row.get("Description") or "").strip() or None),
-                "data_controller_organisation": (row.get("DataControllerOrganisation") or "").strip(),
-                "involves_ucl_sponsorship": to_bool(row.get("InvolvesUclSponsorship")),
-                "involves_cag": to_bool(row.get("InvolvesCag")),
-                "cag_reference": ((row.get("CagReference") or "").strip() or None),
-                "involves_ethics_approval": to_bool(row.get("InvolvesEthicsApproval")),
-                "involves_hra_approval": to_bool(row.get("InvolvesHraApproval")),
-                "iras_id": ((row.get("IrasId") or "").strip() or None),
-                "is_nhs_associated": to_bool(row.get("IsNhsAssociated")),
-                "involves_nhs_england": to_bool(row.get("InvolvesNhsEngland")),
-                "nhs_england_reference": ((row.get("NhsEnglandReference") or "").strip() or None),
-                "involves_mnca": to_bool(row.get("InvolvesMnca")),
-                "requires_dspt": to_bool(row.get("RequiresDspt")),
-                "requires_dbs": to_bool(row.get("RequiresDbs")),
-                "is_data_protection_office_registered": (True if ((row.get("DataProtectionNumber") or "").strip()) else None),
-                "data_protection_number": ((row.get("DataProtectionNumber") or "").strip() or None),
-                "involves_third_party": to_bool(row.get("InvolvesThirdParty")),
-                "involves_external_users": to_bool(row.get("InvolvesExternalUsers")),
-                "involves_participant_consent": to_bool(row.get("InvolvesParticipantConsent")),
-                "involves_indirect_data_collection": to_bool(row.get("InvolvesIndirectDataCollection")),
-                "involves_data_processing_outside_uk_eea": to_bool(row.get("InvolvesDataProcessingOutsideUkEea")),
-                "dsh_active": to_bool(row.get("DSHActive")),
-                "last_signoff" : last_signoff,
-                "feedback": ((row.get("Feedback") or "").strip() or None),
-                
-
-                "contracts": [],
-                "assets": [],
-            }
+    for values in zip(*columns):
+        study = dict(zip(keys, values))
+        study["contracts"] = []
+        study["assets"] = []
+        # if study["caseref"] in studies:
+        #     raise ValueError(f"Duplicate CaseRef in studies.csv: {study['caseref']}")
+        studies[study["caseref"]] = study
     return studies
 
 
+def _invalid_dates_error(source: str, bad_dates: List[Tuple[int, str]]) -> ValueError:
+    """Build one error for every unparseable date a reader collected, naming the first."""
+    line, raw = bad_dates[0]
+    more = f" (and {len(bad_dates) - 1} more)" if len(bad_dates) > 1 else ""
+    return ValueError(
+        f"Invalid date format (expected DD/MM/YYYY) in {source} "
+        f"line {line}: {raw!r}{more}")
+
+
+def _row_error(source: str, bad_dates: List[Tuple[int, str]], error: ValueError) -> ValueError:
+    """
+    Pick what to raise for a bad row, keeping the first error in file order.
+
+    Dates collected from earlier lines (or this one) would have been raised
+    first when they were checked inline, so they still take precedence.
+    """
+    if VALIDATE_DATES and bad_dates:
+        return _invalid_dates_error(source, bad_dates)
+    return error
+
+
 def read_assets_by_case(filename: str) -> Dict[str, List[dict]]:
     """
     Return dict CaseRef -> [asset dict].
@@ -152,44 +163,68 @@ def read_assets_by_case(filename: str) -> Dict[str, List[dict]]:
       CaseRef,AssetRef,Title,Description,ClassificationImpact,Tier,Protection,LegalBasis,Format,
       ExpiresAt,RequiresContract,HasDspt,StoredOutsideUkEea,Status,Locations
     """
-    grouped: Dict[str, List[dict]] = {}
-    with open(filename, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        clean_headers(reader)
-        for i, row in enumerate(reader, start=2):
-            case_ref = (row.get("CaseRef") or "").strip()
-            if not case_ref:
-                raise ValueError(f"Asset row missing CaseRef (line {i})")
-            
-            expires_raw = row.get("Next Scheduled Review")
-            expires_at = parse_date(expires_raw) # `return dt.strftime("%Y-%m-%d")` i.e. returns ISO-format string
-
-            if VALIDATE_DATES and (expires_raw or "").strip() and expires_at is None:
-                raise ValueError(
-                    f"Invalid date format (expected DD/MM/YYYY) in assets.csv "
-                    f"line {i}: {expires_raw!r}")
-
-            asset = {
-                "creator_userID": (row.get("Created By") or "").strip(),
-                "caseref": case_ref,
-                "asset_sp_id": (row.get("ID") or "").strip(),  # optional natural key for assets
-                "title": (row.get("Description") or "").strip(),
-                "description": (row.get("Description") or "").strip(),
-                "classification_impact": (row.get("Classification") or "").strip(),
-                "tier": int(row.get("Tier") or "0"),
-                "protection": (row.get("Impact Mitigation") or "").strip(),
-                "legal_basis": (row.get("Legal Basis") or "").strip(),
-                "format": (row.get("Format") or "").strip(),
-                "expires_at": expires_at,
-                "requires_contract": to_bool(row.get("RequiresContract")),
-                "has_dspt": to_bool(row.get("DSP Toolkit")),
-                "stored_outside_uk_eea": to_bool(row.get("Outside EEA")),
-                "status": (row.get("STATUS") or "").strip(),
-                "locations": (row.get("Current Location")),
-                # no contracts at asset level
-            }
-            grouped.setdefault(case_ref, []).append(asset)
-    return grouped
+    assets: List[dict] = []
+    bad_dates: List[Tuple[int, str]] = []  # (line, raw value) that failed to parse
+    columns = (
+        "CaseRef", "Created By", "ID", "Description", "Classification", "Tier",
+        "Impact Mitigation", "Legal Basis", "Format", "Next Scheduled Review",
+        "RequiresContract", "DSP Toolkit", "Outside EEA", "STATUS", "Current Location",
+    )
+    for i, (
+        case_ref, created_by, sp_id, description, classification, tier,
+        protection, legal_basis, fmt, expires_raw,
+        requires_contract, has_dspt, outside_eea, status, locations,
+    ) in enumerate(read_columns(filename, columns), start=2):
+        case_ref = (case_ref or "").strip()
+        if not case_ref:
+            raise _row_error(
+                "assets.csv", bad_dates, ValueError(f"Asset row missing CaseRef (line {i})"))
+
+        expires_at = parse_date(expires_raw)  # ISO-format string, or None if blank or malformed
+        if expires_at is None and (expires_raw or "").strip():
+            bad_dates.append((i, expires_raw))
+
+        try:
+            tier_value = int(tier or "0")
+        except ValueError:
+            raise _row_error(
+                "assets.csv", bad_dates, ValueError(f"Invalid Tier in assets.csv line {i}: {tier!r}")
+            ) from None
+
+        description = (description or "").strip()
+        asset = {
+            "creator_userID": (created_by or "").strip(),
+            "caseref": case_ref,
+            "asset_sp_id": (sp_id or "").strip(),  # optional natural key for assets
+            "title": description,
+            "description": description,
+            # Low-cardinality categorical fields are interned so repeated values share one string
+            "classification_impact": sys.intern((classification or "").strip()),
+            "tier": tier_value,
+            "protection": sys.intern((protection or "").strip()),
+            "legal_basis": sys.intern((legal_basis or "").strip()),
+            "format": sys.intern((fmt or "").strip()),
+            "expires_at": expires_at,
+            "requires_contract": to_bool(requires_contract),
+            "has_dspt": to_bool(has_dspt),
+            "stored_outside_uk_eea": to_bool(outside_eea),
+            "status": sys.intern((status or "").strip()),
+            "locations": locations,
+            # no contracts at asset level
+        }
+        assets.append(asset)
+
+    if VALIDATE_DATES and bad_dates:
+        raise _invalid_dates_error("assets.csv", bad_dates)
+
+    # Sort assets deterministically (by asset_sp_id, then title) in one pass;
+    # grouping keeps that order, so each study's assets arrive already sorted
+    assets.sort(key=itemgetter("asset_sp_id", "title"))
+
+    grouped: Dict[str, List[dict]] = defaultdict(list)
+    for asset in assets:
+        grouped[asset["caseref"]].append(asset)
+    return dict(grouped)
 
 
 def read_study_contracts(filename: str) -> Dict[str, List[dict]]:
@@ -199,45 +234,46 @@ def read_study_contracts(filename: str) -> Dict[str, List[dict]]:
     Expected headers include:
       CaseRef,ID,Filename,Status,StartDate,ExpiryDate,OrganisationSignatory,ThirdPartyName,CreatorUsername
     """
-    grouped: Dict[str, List[dict]] = {}
-    with open(filename, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        clean_headers(reader)
-        for i, row in enumerate(reader, start=2):
-            case_ref = (row.get("CaseRef") or "").strip()
-            if not case_ref:
-                raise ValueError(f"Contract row missing CaseRef (line {i})")
-            
-            start_raw = row.get("Agreement date")
-            start_date = parse_date(start_raw)
-
-            if VALIDATE_DATES and (start_raw or "").strip() and start_date is None:
-                raise ValueError(
-                    f"Invalid date format (expected DD/MM/YYYY) in contracts.csv "
-                    f"line {i}: {start_raw!r}")
-            
-            end_raw = row.get("Contract expiry or review date")
-            end_date = parse_date(end_raw)
-
-            if VALIDATE_DATES and (end_raw or "").strip() and end_date is None:
-                raise ValueError(
-                    f"Invalid date format (expected DD/MM/YYYY) in contracts.csv "
-                    f"line {i}: {end_raw!r}")
-
-            contract = {
-                "creator_userID": (row.get("Created By") or "").strip(),
-                "caseref": case_ref,
-                "contract_sp_id": (row.get("ID") or "").strip(),
-                "filename": (row.get("Agreement Reference") or "").strip(),
-                "status": (row.get("STATUS") or "").strip(),
-                "start_date": start_date,  # ISO-format string
-                "expiry_date": end_date,  # ISO-format string
-                "organisation_signatory": ((row.get("UCL signatory") or "").strip() or None),
-                "third_party_name": ((row.get("Third party") or "").strip() or None),
-                "creator_username": ((row.get("CreatorUsername") or "").strip() or None),
-            }
-            grouped.setdefault(case_ref, []).append(contract)
-    return grouped
+    grouped: Dict[str, List[dict]] = defaultdict(list)
+    bad_dates: List[Tuple[int, str]] = []  # (line, raw value) that failed to parse
+    columns = (
+        "CaseRef", "Created By", "ID", "Agreement Reference", "STATUS", "Agreement date",
+        "Contract expiry or review date", "UCL signatory", "Third party", "CreatorUsername",
+    )
+    for i, (
+        case_ref, created_by, sp_id, reference, status, start_raw,
+        end_raw, signatory, third_party, creator_username,
+    ) in enumerate(read_columns(filename, columns), start=2):
+        case_ref = (case_ref or "").strip()
+        if not case_ref:
+            raise _row_error(
+                "contracts.csv", bad_dates, ValueError(f"Contract row missing CaseRef (line {i})"))
+
+        start_date = parse_date(start_raw)
+        if start_date is None and (start_raw or "").strip():
+            bad_dates.append((i, start_raw))
+
+        end_date = parse_date(end_raw)
+        if end_date is None and (end_raw or "").strip():
+            bad_dates.append((i, end_raw))
+
+        contract = {
+            "creator_userID": (created_by or "").strip(),
+            "caseref": case_ref,
+            "contract_sp_id": (sp_id or "").strip(),
+            "filename": (reference or "").strip(),
+            "status": sys.intern((status or "").strip()),
+            "start_date": start_date,  # ISO-format string
+            "expiry_date": end_date,  # ISO-format string
+            "organisation_signatory": ((signatory or "").strip() or None),
+            "third_party_name": ((third_party or "").strip() or None),
+            "creator_username": ((creator_username or "").strip() or None),
+        }
+        grouped[case_ref].append(contract)
+
+    if VALIDATE_DATES and bad_dates:
+        raise _invalid_dates_error("contracts.csv", bad_dates)
+    return dict(grouped)
 
 
 def build_import_json(
@@ -247,92 +283,124 @@ def build_import_json(
 ) -> List[dict]:
     output: List[dict] = []
 
-    for case_ref, study in studies.items():
+    # Walk studies in CaseRef order for deterministic output
+    for case_ref in sorted(studies):
+        study = studies[case_ref]
+
         # Study-level contracts
         study["contracts"] = study_contracts_by_case.get(case_ref, [])
 
-        # Assets for this study
-        assets = assets_by_case.get(case_ref, [])
-        for a in assets:
-            expiry = a.get("expires_at")
-            if expiry is not None:
-                a["expires_at"] = expiry
-
-        # Sort assets deterministically (by asset_sp_id, then title)
-        assets.sort(key=lambda a: (a.get("asset_sp_id", ""), a.get("title", "")))
-        study["assets"] = assets
+        # Assets for this study, already sorted by read_assets_by_case
+        study["assets"] = assets_by_case.get(case_ref, [])
 
         output.append(study)
 
-    # Sort studies by CaseRef for deterministic output
-    output.sort(key=lambda s: s.get("caseref", ""))
     return output
 
 
 def validate(import_data: List[dict], validate_dates: bool = False) -> List[str]:
+    """
+    Check merged data for missing and duplicate identifiers in one pass.
+
+    Dates from parse_date are already ISO strings or None, so they are only
+    re-checked when validate_dates is set (for data not built by the readers).
+    """
     errors: List[str] = []
-    seen_case: set[str] = set()
-    seen_asset: set[str] = set()
-    seen_contract: set[str] = set()
+    case_refs: List[str] = []
+    asset_ids: List[str] = []
+    contract_ids: List[str] = []
 
     for s in import_data:
         cr = s.get("caseref", "")
-        if not cr:
-            errors.append("Study missing CaseRef")
-        elif cr in seen_case:
-            errors.append(f"Duplicate CaseRef in merged data: {cr}")
+        if cr:
+            case_refs.append(cr)
         else:
-            seen_case.add(cr)
+            errors.append("Study missing CaseRef")
 
         # study-level contracts only
         for c in s.get("contracts", []):
             cref = c.get("contract_sp_id", "")
-            if not cref:
-                errors.append(f"Study {cr}: contract missing contract_sp_id")
-            elif cref in seen_contract:
-                errors.append(f"Duplicate contract_sp_id: {cref}")
+            if cref:
+                contract_ids.append(cref)
             else:
-                seen_contract.add(cref)
+                errors.append(f"Study {cr}: contract missing contract_sp_id")
             if validate_dates:
                 sd = c.get("start_date") or ""
                 ed = c.get("expiry_date") or ""
-                if sd and not validate_json_date(sd):
+                if sd and not validate_iso_date(sd):
                     errors.append(f"Study {cr}: contract {cref} invalid start_date: {sd}")
-                if ed and not validate_json_date(ed):
+                if ed and not validate_iso_date(ed):
                     errors.append(f"Study {cr}: contract {cref} invalid expiry_date: {ed}")
 
         # assets (no asset-level contracts)
-        for a in s.get("assets", []):
-            aref = a.get("asset_sp_id", "")
-            if aref:
-                if aref in seen_asset:
-                    errors.append(f"Duplicate asset_sp_id: {aref}")
-                else:
-                    seen_asset.add(aref)
-            if validate_dates:
+        assets = s.get("assets", [])
+        asset_ids.extend(a["asset_sp_id"] for a in assets if a.get("asset_sp_id"))
+        if validate_dates:
+            for a in assets:
                 ex = a.get("expires_at") or ""
-                if ex and not validate_json_date(ex):
-                    errors.append(f"Study {cr}: asset {aref} invalid expires_at: {ex}")
+                if ex and not validate_iso_date(ex):
+                    errors.append(f"Study {cr}: asset {a.get('asset_sp_id', '')} invalid expires_at: {ex}")
+
+    # Each duplicated id is reported once per namespace
+    for label, ids in (
+        ("Duplicate CaseRef in merged data", case_refs),
+        ("Duplicate contract_sp_id", contract_ids),
+        ("Duplicate asset_sp_id", asset_ids),
+    ):
+        errors.extend(f"{label}: {k}" for k, n in Counter(ids).items() if n > 1)
 
     return errors
 
 
+def dump_json(data) -> bytes:
+    """Serialise data as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None and JSON_INDENT in (None, 2):  # orjson only indents by 2
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if JSON_INDENT else 0)
+    return json.dumps(data, ensure_ascii=False, indent=JSON_INDENT).encode("utf-8")
+
+
+def write_json(f: BinaryIO, studies: Iterable[dict]) -> None:
+    """
+    Write studies to f as a JSON array, serialising one study at a time.
+
+    Only a single study's bytes are held in memory, rather than the whole
+    document as one string.
+    """
+    if JSON_INDENT is None:
+        start, sep, end = b"[", b",", b"]"
+    else:
+        start, sep, end = b"[\n", b",\n", b"\n]"
+
+    f.write(start)
+    for i, study in enumerate(studies):
+        if i:
+            f.write(sep)
+        f.write(dump_json(study))
+    f.write(end)
+
+
 def main() -> None:
-    studies = read_studies(STUDIES_FILE)
-    assets_by_case = read_assets_by_case(ASSETS_FILE)
-    study_contracts_by_case = read_study_contracts(CONTRACTS_FILE)
+    # The three CSVs are independent; pyarrow parses without holding the GIL,
+    # so when it is installed the reads overlap
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        studies_future = pool.submit(read_studies, STUDIES_FILE)
+        assets_future = pool.submit(read_assets_by_case, ASSETS_FILE)
+        contracts_future = pool.submit(read_study_contracts, CONTRACTS_FILE)
+        studies = studies_future.result()
+        assets_by_case = assets_future.result()
+        study_contracts_by_case = contracts_future.result()
 
     import_data = build_import_json(studies, assets_by_case, study_contracts_by_case)
 
-    errs = validate(import_data, validate_dates=VALIDATE_DATES)
+    errs = validate(import_data)
     if errs:
         print(f"Validation found {len(errs)} issue(s):")
         for e in errs:
             print(" -", e)
         # import sys; sys.exit(1)  # uncomment to fail on validation errors
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(import_data, f, ensure_ascii=False, indent=JSON_INDENT)
+    with open(OUTPUT_FILE, "wb", buffering=1 << 20) as f:
+        write_json(f, import_data)
 
     print(f"Wrote {OUTPUT_FILE} with {len(import_data)} studies")
 